@@ -0,0 +1,163 @@
+# benchmarks/fixture_server.py
+"""
+Writes synthetic seasons as basketball-reference style HTML and serves them.
+
+    python -m benchmarks.fixture_server benchmarks/fixtures --seasons 3
+    python -m benchmarks.fixture_server benchmarks/fixtures --serve
+"""
+import argparse
+import os
+import sys
+import time
+import threading
+from functools import partial
+from html import escape
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from benchmarks.synthetic import MONTHS, SyntheticLeague
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Serves a directory of saved HTML pages on localhost.
+
+    The directory mirrors basketball-reference paths (leagues/NBA_2026.html,
+    leagues/NBA_2026_games-october.html, ...) so NBAStatScraper can be pointed
+    at it through base_url. Write the pages first with write_fixtures (or the
+    command line above), then:
+
+        for year in league.years:
+            write_fixtures(league, year, "benchmarks/fixtures")
+        with FixtureServer("benchmarks/fixtures") as server:
+            scraper = NBAStatScraper(year=2026, base_url=server.url, delay=None)
+    """
+
+    def __init__(self, fixture_dir, host="127.0.0.1", port=0):
+        self.fixture_dir = fixture_dir
+        self.host = host
+        self.port = port
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        if self._httpd is None:
+            raise RuntimeError("Server is not running")
+        return f"http://{self.host}:{self._httpd.server_address[1]}"
+
+    def start(self):
+        handler = partial(_QuietHandler, directory=self.fixture_dir)
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _advanced_stats_html(df):
+    """
+    Render advanced stats the way basketball-reference does, with a group
+    row above the real header (hence read_html(..., header=1) in the scraper).
+    """
+    over_header = '<tr><th colspan="2"></th><th colspan="{}">Advanced</th></tr>'.format(len(df.columns) - 2)
+    header = '<tr>' + ''.join(f'<th>{escape(str(c))}</th>' for c in df.columns) + '</tr>'
+    body = df.to_html(index=False, header=False, na_rep='')
+    # Keep only the <tbody> from pandas and wrap it in our two-row header
+    tbody = body[body.index('<tbody>'):body.index('</tbody>') + len('</tbody>')]
+    return (
+        '<html><body>'
+        '<table id="advanced-team">'
+        f'<thead>{over_header}{header}</thead>'
+        f'{tbody}'
+        '</table>'
+        '</body></html>'
+    )
+
+
+def write_fixtures(league, year, fixture_dir):
+    """
+    Save one synthetic season as basketball-reference style HTML pages.
+
+    Returns the list of files written.
+    """
+    leagues_dir = os.path.join(fixture_dir, 'leagues')
+    os.makedirs(leagues_dir, exist_ok=True)
+    written = []
+
+    path = os.path.join(leagues_dir, f'NBA_{year}.html')
+    with open(path, 'w') as f:
+        f.write(_advanced_stats_html(league.advanced_stats(year)))
+    written.append(path)
+
+    schedule = league.schedule(year)
+    # read_html renames the second 'PTS' column to 'PTS.1'; write it back as the
+    # site has it, and blank the pandas 'Unnamed' placeholders
+    schedule = schedule.rename(columns={'PTS.1': 'PTS', 'Unnamed: 6': '', 'Unnamed: 7': ''})
+    month = pd.to_datetime(schedule['Date'], format='%a, %b %d, %Y').dt.month_name().str.lower()
+    for name in MONTHS:
+        games = schedule[month.to_numpy() == name]
+        if games.empty:
+            continue
+        path = os.path.join(leagues_dir, f'NBA_{year}_games-{name}.html')
+        with open(path, 'w') as f:
+            f.write('<html><body>')
+            f.write(games.to_html(index=False, na_rep='', table_id='schedule'))
+            f.write('</body></html>')
+        written.append(path)
+
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Save synthetic seasons as HTML fixtures.")
+    parser.add_argument('fixture_dir', help="Directory to write the pages into")
+    parser.add_argument('--seasons', type=int, default=1, help="Number of synthetic seasons (1-50)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--serve', action='store_true',
+                        help="Serve the directory on localhost until interrupted")
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.seasons <= 50:
+        parser.error("--seasons must be between 1 and 50")
+
+    league = SyntheticLeague(seasons=args.seasons, seed=args.seed)
+    written = []
+    for year in league.years:
+        written.extend(write_fixtures(league, year, args.fixture_dir))
+    print(f"Wrote {len(written)} pages for {league.years[0]}-{league.years[-1]} to: {args.fixture_dir}")
+
+    if args.serve:
+        with FixtureServer(args.fixture_dir, port=args.port) as server:
+            print(f"Serving at {server.url} (Ctrl+C to stop)")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
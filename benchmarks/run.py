@@ -0,0 +1,279 @@
+# benchmarks/run.py
+"""
+Times each stage of the pipeline on synthetic seasons.
+
+    python -m benchmarks.run --seasons 10
+    python -m benchmarks.run --seasons 10 --scrape --save-baseline
+    python -m benchmarks.run --seasons 10 --baseline benchmarks/baseline.json
+
+Results are written as JSON with throughput (rows/sec) and peak traced
+memory per stage. When a baseline is given, any stage that got slower or
+hungrier than the tolerance allows is reported and the exit code is 1.
+If the baseline was recorded with a different --seasons, --repeat or
+--seed the exit code is 2, unless --force is given.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+import numpy as np
+import sklearn
+
+from src.processor import DataProcessor
+from src.model import NBAModel
+from src.odds import OddsProvider
+from src.scraper import NBAStatScraper
+from benchmarks.synthetic import SyntheticLeague, TEAMS
+from benchmarks.fixture_server import FixtureServer, write_fixtures
+
+STAT_COLUMNS = ['v_pace', 'v_ortg', 'v_drtg', 'v_nrtg', 'h_pace', 'h_ortg', 'h_drtg', 'h_nrtg']
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def _measure(fn, repeat):
+    """Best wall time over `repeat` runs, plus peak memory from one traced run."""
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(times), peak
+
+
+def _check_scrape(schedules, base_url):
+    """
+    Scrape every season once and make sure nothing was silently dropped.
+
+    Returns the number of schedule rows scraped.
+    """
+    rows = 0
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        for year, raw in schedules.items():
+            scraper = NBAStatScraper(year=year, base_url=base_url, delay=None)
+            stats = scraper.scrape_advanced_stats()
+            schedule = scraper.scrape_schedule()
+            expected = len(raw)
+            if stats is None or len(stats) != len(TEAMS):
+                found = 0 if stats is None else len(stats)
+                raise RuntimeError(f"Scraped {found} teams for {year}, expected {len(TEAMS)}\n{log.getvalue()}")
+            if len(schedule) != expected:
+                raise RuntimeError(f"Scraped {len(schedule)} games for {year}, expected {expected}\n{log.getvalue()}")
+            rows += len(schedule)
+    return rows
+
+
+def _record(results, name, rows, seconds, peak):
+    results[name] = {
+        'rows': int(rows),
+        'seconds': round(seconds, 6),
+        'rows_per_sec': round(rows / seconds, 2) if seconds > 0 else None,
+        'peak_mem_mb': round(peak / 2**20, 3),
+    }
+    print(f"  {name:<9} {rows:>9} rows  {seconds:9.4f}s  "
+          f"{results[name]['rows_per_sec'] or 0:>14,.0f} rows/s  {results[name]['peak_mem_mb']:9.2f} MB")
+
+
+def run_benchmarks(seasons, repeat=3, scrape=False, seed=42):
+    league = SyntheticLeague(seasons=seasons, seed=seed)
+    processor = DataProcessor()
+    odds_provider = OddsProvider()
+    results = {}
+
+    # Inputs for every stage are built up front so only the stage itself is timed
+    schedules = {year: league.schedule(year) for year in league.years}
+    adv_stats = {year: league.advanced_stats(year) for year in league.years}
+    raw_schedule = pd.concat(schedules.values(), ignore_index=True)
+    # Half-played seasons, so clean_schedule has unscored games to drop
+    mid_season_schedule = league.all_schedules(played_fraction=0.5)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned = {year: processor.clean_schedule(df) for year, df in schedules.items()}
+        merged = pd.concat([processor.merge_stats(cleaned[year], adv_stats[year]) for year in league.years],
+                           ignore_index=True)
+        # Only the stat columns matter here; the site's Notes/Arena columns are mostly blank
+        merged = merged.dropna(subset=STAT_COLUMNS)
+        X, y = processor.prepare_features(merged)
+        model = NBAModel()
+        model.train(X, y)
+    moneylines = league.all_odds()[['away_odds', 'home_odds']].to_numpy().ravel().tolist()
+
+    print(f"Benchmarking {seasons} season(s), best of {repeat}:")
+
+    seconds, peak = _measure(lambda: processor.clean_schedule(raw_schedule), repeat)
+    _record(results, 'clean', len(raw_schedule), seconds, peak)
+
+    seconds, peak = _measure(lambda: processor.clean_schedule(mid_season_schedule), repeat)
+    _record(results, 'clean_mid', len(mid_season_schedule), seconds, peak)
+
+    # Stats are per season, so merging is done season by season as in training
+    def merge():
+        for year in league.years:
+            processor.merge_stats(cleaned[year], adv_stats[year])
+    seconds, peak = _measure(merge, repeat)
+    _record(results, 'merge', sum(len(df) for df in cleaned.values()), seconds, peak)
+
+    seconds, peak = _measure(lambda: processor.prepare_features(merged), repeat)
+    _record(results, 'features', len(merged), seconds, peak)
+
+    seconds, peak = _measure(lambda: NBAModel().train(X, y), repeat)
+    _record(results, 'fit', len(X), seconds, peak)
+
+    seconds, peak = _measure(lambda: model.predict_probs(X), repeat)
+    _record(results, 'score', len(X), seconds, peak)
+
+    def convert():
+        for odds in moneylines:
+            odds_provider.american_to_decimal(odds)
+            odds_provider.american_to_probability(odds)
+    seconds, peak = _measure(convert, repeat)
+    _record(results, 'odds', len(moneylines), seconds, peak)
+
+    if scrape:
+        with tempfile.TemporaryDirectory() as fixture_dir:
+            for year in league.years:
+                write_fixtures(league, year, fixture_dir)
+            with FixtureServer(fixture_dir) as server:
+                def scrape_all():
+                    for year in league.years:
+                        scraper = NBAStatScraper(year=year, base_url=server.url, delay=None)
+                        scraper.scrape_advanced_stats()
+                        scraper.scrape_schedule()
+
+                # The scraper swallows its own errors, so check one untimed run
+                # actually returned everything before timing it
+                scraped_rows = _check_scrape(schedules, server.url)
+                seconds, peak = _measure(scrape_all, repeat)
+        _record(results, 'scrape', scraped_rows, seconds, peak)
+
+    return {
+        'meta': {
+            'seasons': seasons,
+            'repeat': repeat,
+            'seed': seed,
+            'timestamp': pd.Timestamp.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'sklearn': sklearn.__version__,
+            'machine': platform.machine(),
+        },
+        'benchmarks': results,
+    }
+
+
+def meta_mismatches(current, baseline):
+    """Settings that differ between two runs and make their numbers incomparable."""
+    return [
+        f"{key}: baseline {baseline['meta'].get(key)}, this run {current['meta'][key]}"
+        for key in ('seasons', 'repeat', 'seed')
+        if baseline['meta'].get(key) != current['meta'][key]
+    ]
+
+
+def compare(current, baseline, tolerance=0.2):
+    """
+    Compare two result dicts stage by stage.
+
+    Returns a list of regression messages; empty means nothing regressed.
+    """
+    regressions = []
+    print(f"\nComparison against baseline (tolerance {tolerance:.0%}):")
+    for name, cur in current['benchmarks'].items():
+        base = baseline['benchmarks'].get(name)
+        if base is None:
+            print(f"  {name:<9} no baseline")
+            continue
+
+        speed = cur['rows_per_sec'] / base['rows_per_sec'] if cur['rows_per_sec'] and base['rows_per_sec'] else 1.0
+        memory = cur['peak_mem_mb'] / base['peak_mem_mb'] if base['peak_mem_mb'] else 1.0
+        status = 'ok'
+        if speed < 1 - tolerance:
+            status = 'SLOWER'
+            regressions.append(f"{name}: throughput {speed:.2f}x of baseline")
+        if memory > 1 + tolerance:
+            status = 'MORE MEMORY' if status == 'ok' else status + ', MORE MEMORY'
+            regressions.append(f"{name}: peak memory {memory:.2f}x of baseline")
+        print(f"  {name:<9} throughput {speed:5.2f}x  memory {memory:5.2f}x  {status}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the NBA EV pipeline on synthetic data.")
+    parser.add_argument('--seasons', type=int, default=5, help="Number of synthetic seasons (1-50)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per stage; the best is kept")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--scrape', action='store_true',
+                        help="Also time NBAStatScraper against a local fixture server")
+    parser.add_argument('--output', default='bench_output.json', help="Where to write the results JSON")
+    parser.add_argument('--baseline', help="Baseline JSON to compare against")
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE,
+                        help=f"Also store the results as the baseline (default {DEFAULT_BASELINE})")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed relative slowdown / memory growth before flagging a regression")
+    parser.add_argument('--force', action='store_true',
+                        help="Compare against a baseline even if --seasons, --repeat or --seed differ")
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.seasons <= 50:
+        parser.error("--seasons must be between 1 and 50")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.tolerance < 0:
+        parser.error("--tolerance must not be negative")
+
+    results = run_benchmarks(args.seasons, repeat=args.repeat, scrape=args.scrape, seed=args.seed)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {args.output}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        mismatches = meta_mismatches(results, baseline)
+        if mismatches:
+            print("\nBaseline was recorded with different settings:")
+            for message in mismatches:
+                print(f"  {message}")
+            if not args.force:
+                print("Re-run with matching settings, or pass --force to compare anyway.")
+                return 2
+        regressions = compare(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print("\nRegressions found:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\nNo regressions.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
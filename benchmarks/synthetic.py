@@ -0,0 +1,160 @@
+# benchmarks/synthetic.py
+import pandas as pd
+import numpy as np
+
+TEAMS = [
+    'Atlanta Hawks', 'Boston Celtics', 'Brooklyn Nets', 'Charlotte Hornets',
+    'Chicago Bulls', 'Cleveland Cavaliers', 'Dallas Mavericks', 'Denver Nuggets',
+    'Detroit Pistons', 'Golden State Warriors', 'Houston Rockets', 'Indiana Pacers',
+    'Los Angeles Clippers', 'Los Angeles Lakers', 'Memphis Grizzlies', 'Miami Heat',
+    'Milwaukee Bucks', 'Minnesota Timberwolves', 'New Orleans Pelicans', 'New York Knicks',
+    'Oklahoma City Thunder', 'Orlando Magic', 'Philadelphia 76ers', 'Phoenix Suns',
+    'Portland Trail Blazers', 'Sacramento Kings', 'San Antonio Spurs', 'Toronto Raptors',
+    'Utah Jazz', 'Washington Wizards'
+]
+
+MONTHS = ['october', 'november', 'december', 'january', 'february', 'march', 'april']
+
+GAMES_PER_SEASON = 1230
+
+
+class SyntheticLeague:
+    """
+    Generates fake seasons shaped like the basketball-reference tables.
+
+    Schedule frames carry the same columns pd.read_html produces for the
+    games pages ('Date', 'Visitor/Neutral', 'PTS', 'Home/Neutral', 'PTS.1', ...)
+    and advanced stats frames carry 'Team', 'Pace', 'ORtg', 'DRtg', 'NRtg', so
+    both can be fed straight into DataProcessor.
+    """
+
+    def __init__(self, seasons=1, first_year=2026, seed=42):
+        if not 1 <= seasons <= 50:
+            raise ValueError("seasons must be between 1 and 50")
+        self.seasons = seasons
+        self.first_year = first_year
+        self.seed = seed
+
+    @property
+    def years(self):
+        return list(range(self.first_year - self.seasons + 1, self.first_year + 1))
+
+    def _rng(self, year, salt):
+        return np.random.default_rng([self.seed, year, salt])
+
+    def advanced_stats(self, year):
+        """Team advanced stats for one season, including the 'League Average' row."""
+        rng = self._rng(year, 0)
+        n = len(TEAMS)
+        ortg = rng.normal(114.0, 3.5, n)
+        drtg = rng.normal(114.0, 3.5, n)
+        nrtg = ortg - drtg
+        pace = rng.normal(99.0, 2.0, n)
+        wins = np.clip(np.round(41 + nrtg * 2.7), 10, 72).astype(int)
+
+        # Playoff teams get an asterisk on basketball-reference
+        playoff = np.argsort(-nrtg)[:16]
+        names = [f"{team}*" if i in playoff else team for i, team in enumerate(TEAMS)]
+
+        df = pd.DataFrame({
+            'Rk': np.arange(1, n + 1).astype(float),
+            'Team': names,
+            'Age': np.round(rng.normal(26.5, 1.5, n), 1),
+            'W': wins,
+            'L': 82 - wins,
+            'MOV': np.round(nrtg * 0.98, 2),
+            'SRS': np.round(nrtg * 0.97, 2),
+            'ORtg': np.round(ortg, 1),
+            'DRtg': np.round(drtg, 1),
+            'NRtg': np.round(nrtg, 1),
+            'Pace': np.round(pace, 1),
+            'FTr': np.round(rng.normal(0.25, 0.03, n), 3),
+            '3PAr': np.round(rng.normal(0.40, 0.04, n), 3),
+            'TS%': np.round(rng.normal(0.58, 0.015, n), 3),
+        })
+        league = df.drop(columns=['Team']).mean(numeric_only=True).round(1).to_dict()
+        league.update({'Rk': np.nan, 'Team': 'League Average'})
+        return pd.concat([df, pd.DataFrame([league])], ignore_index=True)
+
+    def schedule(self, year, played_fraction=1.0):
+        """
+        Full regular season schedule for one season.
+
+        Games after played_fraction of the season have blank scores, like the
+        live site mid-season.
+        """
+        rng = self._rng(year, 1)
+        stats = self.advanced_stats(year).iloc[:-1]
+        strength = dict(zip(TEAMS, stats['NRtg'].to_numpy()))
+
+        visitor_idx = rng.integers(0, len(TEAMS), GAMES_PER_SEASON)
+        offset = rng.integers(1, len(TEAMS), GAMES_PER_SEASON)
+        home_idx = (visitor_idx + offset) % len(TEAMS)
+        visitors = np.array(TEAMS)[visitor_idx]
+        homes = np.array(TEAMS)[home_idx]
+
+        # Home court is worth roughly 2.5 points
+        margin = (np.array([strength[t] for t in homes])
+                  - np.array([strength[t] for t in visitors]) + 2.5
+                  + rng.normal(0, 12, GAMES_PER_SEASON))
+        total = rng.normal(228, 18, GAMES_PER_SEASON)
+        home_pts = np.round((total + margin) / 2)
+        visitor_pts = np.round((total - margin) / 2)
+        visitor_pts = np.where(home_pts == visitor_pts, visitor_pts - 1, visitor_pts)
+
+        days = np.sort(rng.integers(0, 170, GAMES_PER_SEASON))
+        dates = pd.Timestamp(year=year - 1, month=10, day=22) + pd.to_timedelta(days, unit='D')
+
+        played = np.arange(GAMES_PER_SEASON) < int(GAMES_PER_SEASON * played_fraction)
+        return pd.DataFrame({
+            'Date': dates.strftime('%a, %b %d, %Y'),
+            'Start (ET)': '7:30p',
+            'Visitor/Neutral': visitors,
+            'PTS': np.where(played, visitor_pts, np.nan),
+            'Home/Neutral': homes,
+            'PTS.1': np.where(played, home_pts, np.nan),
+            'Unnamed: 6': np.where(played, 'Box Score', None),
+            'Unnamed: 7': None,
+            'Attend.': rng.integers(15000, 21000, GAMES_PER_SEASON),
+            'LOG': None,
+            'Arena': None,
+            'Notes': None,
+        })
+
+    def odds(self, year, n_games=None):
+        """
+        Moneyline odds in the layout OddsProvider reads from CSV.
+
+        Lines are priced off the synthetic team strengths with a ~4.5% vig.
+        """
+        rng = self._rng(year, 2)
+        schedule = self.schedule(year)
+        if n_games is not None:
+            schedule = schedule.head(n_games)
+        stats = self.advanced_stats(year).iloc[:-1]
+        strength = dict(zip(TEAMS, stats['NRtg'].to_numpy()))
+
+        margin = (schedule['Home/Neutral'].map(strength)
+                  - schedule['Visitor/Neutral'].map(strength) + 2.5
+                  + rng.normal(0, 1.5, len(schedule)))
+        home_prob = 1 / (1 + np.exp(-margin.to_numpy() / 6.5))
+
+        return pd.DataFrame({
+            'game_date': pd.to_datetime(schedule['Date'], format='%a, %b %d, %Y').dt.strftime('%Y-%m-%d'),
+            'away_team': schedule['Visitor/Neutral'],
+            'home_team': schedule['Home/Neutral'],
+            'away_odds': self._to_american((1 - home_prob) * 1.045),
+            'home_odds': self._to_american(home_prob * 1.045),
+        })
+
+    @staticmethod
+    def _to_american(prob):
+        prob = np.clip(prob, 0.01, 0.99)
+        odds = np.where(prob >= 0.5, -100 * prob / (1 - prob), 100 * (1 - prob) / prob)
+        return np.round(odds).astype(int)
+
+    def all_schedules(self, played_fraction=1.0):
+        return pd.concat([self.schedule(year, played_fraction) for year in self.years], ignore_index=True)
+
+    def all_odds(self):
+        return pd.concat([self.odds(year) for year in self.years], ignore_index=True)
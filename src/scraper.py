@@ -3,9 +3,11 @@ import time
 import random
 
 class NBAStatScraper:
-    def __init__(self, year=2026):
+    def __init__(self, year=2026, base_url="https://www.basketball-reference.com", delay=(3, 5)):
         self.year = year
-        self.base_url = "https://www.basketball-reference.com"
+        self.base_url = base_url
+        # (min, max) seconds to wait between month requests; None disables it
+        self.delay = delay
 
     def scrape_advanced_stats(self):
         """Scrapes Team Advanced Stats (Pace, ORtg, DRtg, etc.)"""
@@ -42,7 +44,8 @@ class NBAStatScraper:
                     schedule_dfs.append(df)
                     print(f"  - Scraped {month}")
                 # Be respectful to the server
-                time.sleep(random.uniform(3, 5))
+                if self.delay:
+                    time.sleep(random.uniform(*self.delay))
             except Exception:
                 # Month might not have started yet
                 continue